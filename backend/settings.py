@@ -124,6 +124,10 @@ else:
         }
     }
 
+# Keep DB connections open between requests instead of reconnecting on
+# every request (Django defaults to CONN_MAX_AGE=0)
+DATABASES['default']['CONN_MAX_AGE'] = 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -192,6 +196,8 @@ CORS_ALLOW_CREDENTIALS = True
 
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
+    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'PAGE_SIZE': 50,
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
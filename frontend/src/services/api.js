@@ -81,13 +81,15 @@ export const getAttritionAnalytics = async (dateRange = null) => {
 
 
 /**
- * Fetch all employees
- * @returns {Promise<Array>} List of employees
+ * Fetch employees (paginated by the API)
+ * @param {number} page - Page number to fetch (defaults to first page)
+ * @returns {Promise<Array>} List of employees for the requested page
  */
-export const getEmployees = async () => {
+export const getEmployees = async (page = 1) => {
   try {
-    const response = await apiClient.get('/employees/');
-    return response.data;
+    const response = await apiClient.get('/employees/', { params: { page } });
+    // Unwrap DRF page envelope ({ count, results, ... })
+    return response.data.results ?? response.data;
   } catch (error) {
     handleApiError(error, 'Failed to fetch employees');
     throw error;
@@ -0,0 +1,118 @@
+"""
+Shared aggregate computations for the analytics and CSV export views.
+
+Each helper issues a single aggregate query, so the dashboard endpoints
+and the export stay in sync on both the numbers and the query cost.
+"""
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from .models import Attendance, Employee, Leave
+
+
+def attendance_in_range(start_date=None, end_date=None):
+    """Return the attendance queryset filtered to the optional date range.
+
+    Built once per request and reused for every summary/detail section so
+    all consumers aggregate over exactly the same rows.
+    """
+    attendance_records = Attendance.objects.all()
+    if start_date:
+        attendance_records = attendance_records.filter(date__gte=start_date)
+    if end_date:
+        attendance_records = attendance_records.filter(date__lte=end_date)
+    return attendance_records
+
+
+def leaves_in_range(start_date=None, end_date=None):
+    """Return the leave queryset filtered to the optional date range."""
+    leave_records = Leave.objects.all()
+    if start_date:
+        leave_records = leave_records.filter(start_date__gte=start_date)
+    if end_date:
+        leave_records = leave_records.filter(end_date__lte=end_date)
+    return leave_records
+
+
+def safe_rate(numerator, denominator):
+    """Return numerator/denominator as a rounded percentage, 0.0 when the
+    denominator is zero."""
+    if not denominator:
+        return 0.0
+    return round((numerator / denominator) * 100, 2)
+
+
+def _day_start(day):
+    """Return an aware datetime for midnight at the start of ``day``."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def build_inactive_filter(start_date=None, end_date=None):
+    """Build a Q filter matching employees who left, optionally limited
+    to an updated_at date window.
+
+    The bounds are plain datetime comparisons (half-open on the end)
+    rather than __date lookups, which would wrap the column in DATE()
+    and stop the (is_active, updated_at) index from being used.
+    """
+    inactive_filter = Q(is_active=False)
+    if start_date:
+        inactive_filter &= Q(updated_at__gte=_day_start(start_date))
+    if end_date:
+        inactive_filter &= Q(updated_at__lt=_day_start(end_date + timedelta(days=1)))
+    return inactive_filter
+
+
+def compute_attendance_summary(attendance_records):
+    """Compute working/absent day counts and the absenteeism rate for a
+    filtered attendance queryset in one aggregate query."""
+    totals = attendance_records.aggregate(
+        total=Count('id'),
+        absent=Count('id', filter=Q(status='absent'))
+    )
+    total_working_days = totals['total']
+    total_absent_days = totals['absent']
+
+    return {
+        'total_working_days': total_working_days,
+        'total_absent_days': total_absent_days,
+        'absenteeism_rate': safe_rate(total_absent_days, total_working_days),
+    }
+
+
+def compute_leave_summary(leave_records):
+    """Compute leave day totals per type for a filtered leave queryset in
+    one grouped query."""
+    days_by_type = {
+        row['leave_type']: row['total'] or 0
+        for row in leave_records.values('leave_type').annotate(total=Sum('days'))
+    }
+    sick_days = days_by_type.get('sick', 0)
+    vacation_days = days_by_type.get('vacation', 0)
+    personal_days = days_by_type.get('personal', 0)
+
+    return {
+        'sick': sick_days,
+        'vacation': vacation_days,
+        'personal': personal_days,
+        'total': sick_days + vacation_days + personal_days,
+    }
+
+
+def compute_attrition_summary(inactive_filter):
+    """Compute total employees, leavers, and the attrition rate in one
+    conditional aggregate query."""
+    counts = Employee.objects.aggregate(
+        total=Count('id'),
+        left=Count('id', filter=inactive_filter)
+    )
+    total_employees = counts['total']
+    employees_left = counts['left']
+
+    return {
+        'total_employees': total_employees,
+        'employees_left': employees_left,
+        'attrition_rate': safe_rate(employees_left, total_employees),
+    }
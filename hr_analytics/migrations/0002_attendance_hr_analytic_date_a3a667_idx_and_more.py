@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date'], name='hr_analytic_date_a3a667_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['status'], name='hr_analytic_status_6130dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['department'], name='hr_analytic_departm_bbb9c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['is_active'], name='hr_analytic_is_acti_0b5109_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['leave_type', 'start_date'], name='hr_analytic_leave_t_50d031_idx'),
+        ),
+    ]
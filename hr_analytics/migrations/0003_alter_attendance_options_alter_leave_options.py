@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:51
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_analytics', '0002_attendance_hr_analytic_date_a3a667_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='attendance',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='leave',
+            options={},
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_analytics', '0003_alter_attendance_options_alter_leave_options'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='hr_analytic_date_a3a667_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='employee',
+            name='hr_analytic_is_acti_0b5109_idx',
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date', 'status'], name='hr_analytic_date_015a95_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['is_active', 'updated_at'], name='hr_analytic_is_acti_f5948d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['start_date'], name='hr_analytic_start_d_94e6c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['end_date'], name='hr_analytic_end_dat_ac31d8_idx'),
+        ),
+    ]
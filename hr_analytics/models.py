@@ -13,11 +13,28 @@ class Employee(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['department']),
+            # Serves the attrition views: filter on is_active plus
+            # range/group on updated_at
+            models.Index(fields=['is_active', 'updated_at']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.department})"
 
 
+class WithEmployeeManager(models.Manager):
+    """Manager that always joins the related employee row.
+
+    Attendance/Leave are nearly always read together with their employee,
+    so fetching the FK up front stops accidental N+1 lookups in new views.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('employee')
+
+
 class Attendance(models.Model):
     """Model representing daily attendance records for employees."""
     
@@ -36,9 +53,21 @@ class Attendance(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = WithEmployeeManager()
+
     class Meta:
-        ordering = ['-date']
+        # No default ordering: these rows are almost always aggregated, and
+        # a Meta.ordering would add an ORDER BY to every unqualified query.
+        # Views that need an order set it explicitly.
         unique_together = ['employee', 'date']
+        indexes = [
+            # (date, status) covers both the date-range filters and the
+            # daily present/absent grouping, and subsumes a plain date
+            # index; (employee, date) is already indexed via
+            # unique_together
+            models.Index(fields=['date', 'status']),
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return f"{self.employee.name} - {self.date} - {self.status}"
@@ -64,8 +93,14 @@ class Leave(models.Model):
     days = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = WithEmployeeManager()
+
     class Meta:
-        ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['leave_type', 'start_date']),
+            models.Index(fields=['start_date']),
+            models.Index(fields=['end_date']),
+        ]
 
     def __str__(self):
         return f"{self.employee.name} - {self.leave_type} ({self.days} days)"
@@ -1,26 +1,20 @@
 from rest_framework import serializers
-from django.db.models import Count, Q
 from .models import Employee, Attendance, Leave
 
 
 class EmployeeSerializer(serializers.ModelSerializer):
-    """Serializer for Employee model with nested attendance/leave counts."""
-    
-    attendance_count = serializers.SerializerMethodField()
-    leave_count = serializers.SerializerMethodField()
-    
+    """Serializer for Employee model with attendance/leave counts."""
+
+    # Populated by the Count() annotations on the EmployeeViewSet queryset.
+    attendance_count = serializers.IntegerField(read_only=True)
+    leave_count = serializers.IntegerField(read_only=True)
+
     class Meta:
         model = Employee
         fields = [
             'id', 'name', 'department', 'hire_date', 'is_active',
             'created_at', 'updated_at', 'attendance_count', 'leave_count'
         ]
-    
-    def get_attendance_count(self, obj):
-        return obj.attendance_records.count()
-    
-    def get_leave_count(self, obj):
-        return obj.leave_records.count()
 
 
 class AttendanceSerializer(serializers.ModelSerializer):
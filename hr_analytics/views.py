@@ -1,56 +1,88 @@
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.db.models import Count, Q, Sum
 from django.db.models.functions import TruncMonth, TruncDate
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 import csv
-import io
-
-from .models import Employee, Attendance, Leave
-from .serializers import (
-    EmployeeSerializer,
-    AttendanceAnalyticsSerializer,
-    LeaveAnalyticsSerializer,
-    AttritionAnalyticsSerializer,
+
+from .analytics import (
+    attendance_in_range,
+    build_inactive_filter,
+    compute_attendance_summary,
+    compute_attrition_summary,
+    compute_leave_summary,
+    leaves_in_range,
+    safe_rate,
 )
+from .models import Employee
+from .serializers import EmployeeSerializer
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(value):
+    """Parse a YYYY-MM-DD string into a date, or None if not provided.
+
+    Cached because polling dashboards send the same handful of date
+    strings over and over, and strptime is surprisingly expensive.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValidationError(
+            {'detail': f"Invalid date '{value}'; expected YYYY-MM-DD."})
 
 
 def parse_date_params(request):
     """
     Parse start_date and end_date query parameters from request.
-    Returns tuple of (start_date, end_date) as date objects or None if not provided.
+    Returns tuple of (start_date, end_date) as date objects or None if not
+    provided; raises ValidationError (a 400 response) on malformed dates.
+    The result is memoized on the request so views and helpers that both
+    need the range don't re-parse it.
     """
-    start_date = request.query_params.get('start_date')
-    end_date = request.query_params.get('end_date')
-    
-    parsed_start = None
-    parsed_end = None
-    
-    if start_date:
-        try:
-            parsed_start = datetime.strptime(start_date, '%Y-%m-%d').date()
-        except ValueError:
-            pass
-    
-    if end_date:
-        try:
-            parsed_end = datetime.strptime(end_date, '%Y-%m-%d').date()
-        except ValueError:
-            pass
-    
-    return parsed_start, parsed_end
+    if not hasattr(request, '_parsed_dates'):
+        request._parsed_dates = (
+            _parse_date(request.query_params.get('start_date')),
+            _parse_date(request.query_params.get('end_date')),
+        )
+    return request._parsed_dates
 
 
 class EmployeeViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for listing and retrieving employees."""
-    
-    queryset = Employee.objects.all()
+
+    # Annotate the counts in the main query so the serializer doesn't fire
+    # two COUNT(*) queries per employee (distinct=True avoids the join
+    # cross-product between the two reverse relations). only() pins the
+    # SELECT list to the serializer's fields so columns added to the model
+    # later aren't fetched here by default.
+    queryset = Employee.objects.only(
+        'id', 'name', 'department', 'hire_date', 'is_active',
+        'created_at', 'updated_at',
+    ).annotate(
+        attendance_count=Count('attendance_records', distinct=True),
+        leave_count=Count('leave_records', distinct=True),
+    ).order_by('name')  # annotate() drops Meta.ordering; pagination needs a stable order
     serializer_class = EmployeeSerializer
 
 
+# Analytics responses change at most daily, so a short server-side cache
+# absorbs repeated dashboard refreshes. cache_page keys on the full URL,
+# so each start_date/end_date combination is cached separately.
+ANALYTICS_CACHE_TIMEOUT = 300
+
+
+@method_decorator(cache_page(ANALYTICS_CACHE_TIMEOUT), name='dispatch')
 class AttendanceAnalyticsView(APIView):
     """API view for attendance analytics with absenteeism calculation."""
     
@@ -59,68 +91,63 @@ class AttendanceAnalyticsView(APIView):
         start_date, end_date = parse_date_params(request)
         
         # Get attendance records with optional date filtering
-        attendance_records = Attendance.objects.all()
-        
-        if start_date:
-            attendance_records = attendance_records.filter(date__gte=start_date)
-        if end_date:
-            attendance_records = attendance_records.filter(date__lte=end_date)
-        
-        # Calculate total working days and absent days
-        total_working_days = attendance_records.count()
-        total_absent_days = attendance_records.filter(status='absent').count()
-        
-        # Calculate absenteeism rate
-        absenteeism_rate = 0.0
-        if total_working_days > 0:
-            absenteeism_rate = (total_absent_days / total_working_days) * 100
-        
-        # Get trend data (daily attendance counts)
-        trend_data = []
+        attendance_records = attendance_in_range(start_date, end_date)
+
+        # Calculate total working days, absent days, and the absenteeism
+        # rate in a single query
+        attendance_summary = compute_attendance_summary(attendance_records)
+
+        # Get trend data (daily attendance counts) as raw tuples to skip
+        # per-row dict construction on the ORM side
         daily_stats = attendance_records.values('date').annotate(
             present_count=Count('id', filter=Q(status='present')),
             absent_count=Count('id', filter=Q(status='absent'))
-        ).order_by('date')
+        ).order_by('date').values_list('date', 'present_count', 'absent_count')
+
+        trend_data = [
+            {'date': day.isoformat(), 'present_count': present, 'absent_count': absent}
+            for day, present, absent in daily_stats.iterator(chunk_size=1000)
+        ]
+        
+        # Get department breakdown (filtered by date range) in one GROUP BY
+        # query. Grouping from the Employee side keeps departments with no
+        # attendance in the date range visible with a zero rate.
+        dept_filter = Q()
+        if start_date:
+            dept_filter &= Q(attendance_records__date__gte=start_date)
+        if end_date:
+            dept_filter &= Q(attendance_records__date__lte=end_date)
 
-        
-        for stat in daily_stats:
-            trend_data.append({
-                'date': stat['date'].isoformat(),
-                'present_count': stat['present_count'],
-                'absent_count': stat['absent_count']
-            })
-        
-        # Get department breakdown (filtered by date range)
         department_breakdown = []
-        departments = Employee.objects.values_list('department', flat=True).distinct()
-        
-        for dept in departments:
-            dept_employees = Employee.objects.filter(department=dept)
-            dept_attendance = attendance_records.filter(employee__in=dept_employees)
-            dept_total = dept_attendance.count()
-            dept_absent = dept_attendance.filter(status='absent').count()
-            
-            dept_rate = 0.0
-            if dept_total > 0:
-                dept_rate = (dept_absent / dept_total) * 100
-            
+        dept_stats = Employee.objects.values('department').annotate(
+            total=Count('attendance_records', filter=dept_filter),
+            absent=Count(
+                'attendance_records',
+                filter=dept_filter & Q(attendance_records__status='absent')
+            )
+        ).order_by()
+
+        for stat in dept_stats:
             department_breakdown.append({
-                'department': dept,
-                'absenteeism_rate': round(dept_rate, 2)
+                'department': stat['department'],
+                'absenteeism_rate': safe_rate(stat['absent'], stat['total'])
             })
         
         data = {
-            'absenteeism_rate': round(absenteeism_rate, 2),
-            'total_working_days': total_working_days,
-            'total_absent_days': total_absent_days,
+            'absenteeism_rate': attendance_summary['absenteeism_rate'],
+            'total_working_days': attendance_summary['total_working_days'],
+            'total_absent_days': attendance_summary['total_absent_days'],
             'trend_data': trend_data,
             'department_breakdown': department_breakdown
         }
         
-        serializer = AttendanceAnalyticsSerializer(data)
-        return Response(serializer.data)
+        # The payload is already plain dicts/lists; returning it directly
+        # skips DRF's field-by-field coercion (the serializer classes in
+        # serializers.py still document the response shape)
+        return Response(data)
 
 
+@method_decorator(cache_page(ANALYTICS_CACHE_TIMEOUT), name='dispatch')
 class LeaveAnalyticsView(APIView):
     """API view for leave analytics with type breakdown."""
     
@@ -129,53 +156,41 @@ class LeaveAnalyticsView(APIView):
         start_date, end_date = parse_date_params(request)
         
         # Get leave records with optional date filtering
-        leave_records = Leave.objects.all()
-        
-        if start_date:
-            leave_records = leave_records.filter(start_date__gte=start_date)
-        if end_date:
-            leave_records = leave_records.filter(end_date__lte=end_date)
-        
-        # Get leave counts by type
-        sick_days = leave_records.filter(leave_type='sick').aggregate(
-            total=Sum('days'))['total'] or 0
-        vacation_days = leave_records.filter(leave_type='vacation').aggregate(
-            total=Sum('days'))['total'] or 0
-        personal_days = leave_records.filter(leave_type='personal').aggregate(
-            total=Sum('days'))['total'] or 0
-        
-        total_leave_days = sick_days + vacation_days + personal_days
+        leave_records = leaves_in_range(start_date, end_date)
+
+        # Get leave counts by type in a single grouped query instead of
+        # one Sum query per type
+        leave_summary = compute_leave_summary(leave_records)
 
-        
         # Get monthly trend
-        monthly_trend = []
         monthly_stats = leave_records.annotate(
             month=TruncMonth('start_date')
         ).values('month').annotate(
             days=Sum('days')
-        ).order_by('month')
-        
-        for stat in monthly_stats:
-            if stat['month']:
-                monthly_trend.append({
-                    'month': stat['month'].strftime('%Y-%m'),
-                    'days': stat['days']
-                })
+        ).exclude(month__isnull=True).order_by('month').values_list('month', 'days')
+
+        monthly_trend = [
+            {'month': month.strftime('%Y-%m'), 'days': days}
+            for month, days in monthly_stats
+        ]
         
         data = {
             'leave_by_type': {
-                'sick': sick_days,
-                'vacation': vacation_days,
-                'personal': personal_days
+                'sick': leave_summary['sick'],
+                'vacation': leave_summary['vacation'],
+                'personal': leave_summary['personal']
             },
-            'total_leave_days': total_leave_days,
+            'total_leave_days': leave_summary['total'],
             'monthly_trend': monthly_trend
         }
         
-        serializer = LeaveAnalyticsSerializer(data)
-        return Response(serializer.data)
+        # The payload is already plain dicts/lists; returning it directly
+        # skips DRF's field-by-field coercion (the serializer classes in
+        # serializers.py still document the response shape)
+        return Response(data)
 
 
+@method_decorator(cache_page(ANALYTICS_CACHE_TIMEOUT), name='dispatch')
 class AttritionAnalyticsView(APIView):
     """API view for attrition metrics."""
     
@@ -183,191 +198,112 @@ class AttritionAnalyticsView(APIView):
         # Parse date filter parameters
         start_date, end_date = parse_date_params(request)
         
-        # Get employee counts
-        total_employees = Employee.objects.count()
-        
-        # Get inactive employees with optional date filtering on updated_at
-        inactive_employees = Employee.objects.filter(is_active=False)
-        
-        if start_date:
-            inactive_employees = inactive_employees.filter(updated_at__date__gte=start_date)
-        if end_date:
-            inactive_employees = inactive_employees.filter(updated_at__date__lte=end_date)
-        
-        employees_left = inactive_employees.count()
-        
-        # Calculate attrition rate
-        attrition_rate = 0.0
-        if total_employees > 0:
-            attrition_rate = (employees_left / total_employees) * 100
-        
+        # Get total and left counts in a single conditional aggregate,
+        # date-filtered on updated_at
+        inactive_filter = build_inactive_filter(start_date, end_date)
+        attrition_summary = compute_attrition_summary(inactive_filter)
+        total_employees = attrition_summary['total_employees']
+
         # Get monthly trend (based on updated_at for inactive employees)
-        monthly_trend = []
-        
-        monthly_stats = inactive_employees.annotate(
+        monthly_stats = Employee.objects.filter(inactive_filter).annotate(
             month=TruncMonth('updated_at')
         ).values('month').annotate(
             left_count=Count('id')
-        ).order_by('month')
-        
-        for stat in monthly_stats:
-            if stat['month']:
-                # Calculate monthly attrition rate
-                month_rate = 0.0
-                if total_employees > 0:
-                    month_rate = (stat['left_count'] / total_employees) * 100
-                
-                monthly_trend.append({
-                    'month': stat['month'].strftime('%Y-%m'),
-                    'left_count': stat['left_count'],
-                    'attrition_rate': round(month_rate, 2)
-                })
+        ).exclude(month__isnull=True).order_by('month').values_list('month', 'left_count')
+
+        monthly_trend = [
+            {
+                'month': month.strftime('%Y-%m'),
+                'left_count': left_count,
+                'attrition_rate': safe_rate(left_count, total_employees)
+            }
+            for month, left_count in monthly_stats
+        ]
         
         data = {
-            'attrition_rate': round(attrition_rate, 2),
-            'employees_left': employees_left,
+            'attrition_rate': attrition_summary['attrition_rate'],
+            'employees_left': attrition_summary['employees_left'],
             'total_employees': total_employees,
             'monthly_trend': monthly_trend
         }
         
-        serializer = AttritionAnalyticsSerializer(data)
-        return Response(serializer.data)
+        # The payload is already plain dicts/lists; returning it directly
+        # skips DRF's field-by-field coercion (the serializer classes in
+        # serializers.py still document the response shape)
+        return Response(data)
+
+
+class Echo:
+    """File-like object whose write() just hands the value back.
+
+    Lets csv.writer format one row at a time for a streaming response
+    instead of accumulating the whole file in a buffer.
+    """
+
+    def write(self, value):
+        return value
+
+
+class CsvBuffer:
+    """Write target for csv.writer that collects formatted rows.
+
+    writerows() discards write() return values, so batched sections write
+    into this buffer and drain it as one response chunk per batch.
+    """
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, value):
+        self._parts.append(value)
+
+    def drain(self):
+        data = ''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def batched(iterable, size):
+    """Yield lists of up to ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 class CSVExportView(APIView):
     """
     API view for exporting dashboard data as CSV.
     Includes attendance, leave, and attrition data in the export.
+    Streams rows as they are fetched so memory stays constant and the
+    download starts immediately, regardless of table size. Exports are
+    always bounded to a date window: when the client omits the range, it
+    defaults to the most recent DEFAULT_WINDOW_DAYS.
     Requirements: 8.1
     """
-    
+
+    # Fallback window so an export without explicit dates can't dump the
+    # entire history in one request
+    DEFAULT_WINDOW_DAYS = 90
+
     def get(self, request):
-        # Parse date filter parameters
+        # Parse date filter parameters, clamping to the default window
+        # when they're missing
         start_date, end_date = parse_date_params(request)
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # --- Attendance Data Section ---
-        writer.writerow(['=== ATTENDANCE DATA ==='])
-        writer.writerow([])
-        
-        # Get attendance records with optional date filtering
-        attendance_records = Attendance.objects.select_related('employee').all()
-        if start_date:
-            attendance_records = attendance_records.filter(date__gte=start_date)
-        if end_date:
-            attendance_records = attendance_records.filter(date__lte=end_date)
-        
-        # Calculate attendance summary
-        total_working_days = attendance_records.count()
-        total_absent_days = attendance_records.filter(status='absent').count()
-        absenteeism_rate = 0.0
-        if total_working_days > 0:
-            absenteeism_rate = (total_absent_days / total_working_days) * 100
-        
-        writer.writerow(['Attendance Summary'])
-        writer.writerow(['Metric', 'Value'])
-        writer.writerow(['Total Working Days', total_working_days])
-        writer.writerow(['Total Absent Days', total_absent_days])
-        writer.writerow(['Absenteeism Rate (%)', round(absenteeism_rate, 2)])
-        writer.writerow([])
-        
-        # Attendance records detail
-        writer.writerow(['Attendance Records'])
-        writer.writerow(['Employee Name', 'Department', 'Date', 'Status'])
-        for record in attendance_records.order_by('date', 'employee__name'):
-            writer.writerow([
-                record.employee.name,
-                record.employee.department,
-                record.date.isoformat(),
-                record.status
-            ])
-        writer.writerow([])
-        
-        # --- Leave Data Section ---
-        writer.writerow(['=== LEAVE DATA ==='])
-        writer.writerow([])
-        
-        # Get leave records with optional date filtering
-        leave_records = Leave.objects.select_related('employee').all()
-        if start_date:
-            leave_records = leave_records.filter(start_date__gte=start_date)
-        if end_date:
-            leave_records = leave_records.filter(end_date__lte=end_date)
-        
-        # Calculate leave summary
-        sick_days = leave_records.filter(leave_type='sick').aggregate(
-            total=Sum('days'))['total'] or 0
-        vacation_days = leave_records.filter(leave_type='vacation').aggregate(
-            total=Sum('days'))['total'] or 0
-        personal_days = leave_records.filter(leave_type='personal').aggregate(
-            total=Sum('days'))['total'] or 0
-        total_leave_days = sick_days + vacation_days + personal_days
-        
-        writer.writerow(['Leave Summary'])
-        writer.writerow(['Leave Type', 'Total Days'])
-        writer.writerow(['Sick', sick_days])
-        writer.writerow(['Vacation', vacation_days])
-        writer.writerow(['Personal', personal_days])
-        writer.writerow(['Total', total_leave_days])
-        writer.writerow([])
-        
-        # Leave records detail
-        writer.writerow(['Leave Records'])
-        writer.writerow(['Employee Name', 'Department', 'Leave Type', 'Start Date', 'End Date', 'Days'])
-        for record in leave_records.order_by('start_date', 'employee__name'):
-            writer.writerow([
-                record.employee.name,
-                record.employee.department,
-                record.leave_type,
-                record.start_date.isoformat(),
-                record.end_date.isoformat(),
-                record.days
-            ])
-        writer.writerow([])
-        
-        # --- Attrition Data Section ---
-        writer.writerow(['=== ATTRITION DATA ==='])
-        writer.writerow([])
-        
-        # Get employee counts
-        total_employees = Employee.objects.count()
-        inactive_employees = Employee.objects.filter(is_active=False)
-        
-        if start_date:
-            inactive_employees = inactive_employees.filter(updated_at__date__gte=start_date)
-        if end_date:
-            inactive_employees = inactive_employees.filter(updated_at__date__lte=end_date)
-        
-        employees_left = inactive_employees.count()
-        attrition_rate = 0.0
-        if total_employees > 0:
-            attrition_rate = (employees_left / total_employees) * 100
-        
-        writer.writerow(['Attrition Summary'])
-        writer.writerow(['Metric', 'Value'])
-        writer.writerow(['Total Employees', total_employees])
-        writer.writerow(['Employees Left', employees_left])
-        writer.writerow(['Attrition Rate (%)', round(attrition_rate, 2)])
-        writer.writerow([])
-        
-        # Employee list
-        writer.writerow(['Employee List'])
-        writer.writerow(['Name', 'Department', 'Hire Date', 'Status'])
-        for emp in Employee.objects.all().order_by('name'):
-            writer.writerow([
-                emp.name,
-                emp.department,
-                emp.hire_date.isoformat(),
-                'Active' if emp.is_active else 'Inactive'
-            ])
-        
-        # Create HTTP response with CSV content
-        output.seek(0)
-        response = HttpResponse(output.getvalue(), content_type='text/csv')
-        
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=self.DEFAULT_WINDOW_DAYS)
+
+        # Build each filtered queryset once; the summary aggregates and the
+        # detail sections all reuse the same object
+        attendance_records = attendance_in_range(start_date, end_date)
+        leave_records = leaves_in_range(start_date, end_date)
+
+        response = StreamingHttpResponse(
+            self._generate_csv(attendance_records, leave_records, start_date, end_date),
+            content_type='text/csv'
+        )
+
         # Generate filename with date range if provided
         filename = 'hr_analytics_export'
         if start_date:
@@ -375,6 +311,99 @@ class CSVExportView(APIView):
         if end_date:
             filename += f'_to_{end_date.isoformat()}'
         filename += '.csv'
-        
+
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
         return response
+
+    def _generate_csv(self, attendance_records, leave_records, start_date, end_date):
+        """Yield the export as CSV chunks: summary rows one at a time,
+        detail sections in writerows() batches."""
+        writer = csv.writer(Echo())
+        buffer = CsvBuffer()
+        buffered_writer = csv.writer(buffer)
+
+        # --- Attendance Data Section ---
+        yield writer.writerow(['=== ATTENDANCE DATA ==='])
+        yield writer.writerow([])
+
+        # Calculate attendance summary with the same single-query helper
+        # the analytics views use
+        attendance_summary = compute_attendance_summary(attendance_records)
+
+        yield writer.writerow(['Attendance Summary'])
+        yield writer.writerow(['Metric', 'Value'])
+        yield writer.writerow(['Total Working Days', attendance_summary['total_working_days']])
+        yield writer.writerow(['Total Absent Days', attendance_summary['total_absent_days']])
+        yield writer.writerow(['Absenteeism Rate (%)', attendance_summary['absenteeism_rate']])
+        yield writer.writerow([])
+
+        # Attendance records detail; values_list returns plain tuples so
+        # no model instances are built per row
+        yield writer.writerow(['Attendance Records'])
+        yield writer.writerow(['Employee Name', 'Department', 'Date', 'Status'])
+        attendance_rows = attendance_records.order_by('date', 'employee__name').values_list(
+            'employee__name', 'employee__department', 'date', 'status')
+        for chunk in batched(attendance_rows.iterator(chunk_size=2000), 2000):
+            buffered_writer.writerows(
+                (name, department, day.isoformat(), record_status)
+                for name, department, day, record_status in chunk)
+            yield buffer.drain()
+        yield writer.writerow([])
+
+        # --- Leave Data Section ---
+        yield writer.writerow(['=== LEAVE DATA ==='])
+        yield writer.writerow([])
+
+        # Calculate leave summary with the shared grouped-query helper
+        leave_summary = compute_leave_summary(leave_records)
+
+        yield writer.writerow(['Leave Summary'])
+        yield writer.writerow(['Leave Type', 'Total Days'])
+        yield writer.writerow(['Sick', leave_summary['sick']])
+        yield writer.writerow(['Vacation', leave_summary['vacation']])
+        yield writer.writerow(['Personal', leave_summary['personal']])
+        yield writer.writerow(['Total', leave_summary['total']])
+        yield writer.writerow([])
+
+        # Leave records detail
+        yield writer.writerow(['Leave Records'])
+        yield writer.writerow(['Employee Name', 'Department', 'Leave Type', 'Start Date', 'End Date', 'Days'])
+        leave_rows = leave_records.order_by('start_date', 'employee__name').values_list(
+            'employee__name', 'employee__department', 'leave_type',
+            'start_date', 'end_date', 'days')
+        for chunk in batched(leave_rows.iterator(chunk_size=2000), 2000):
+            buffered_writer.writerows(
+                (name, department, leave_type, start.isoformat(), end.isoformat(), days)
+                for name, department, leave_type, start, end, days in chunk)
+            yield buffer.drain()
+        yield writer.writerow([])
+
+        # --- Attrition Data Section ---
+        yield writer.writerow(['=== ATTRITION DATA ==='])
+        yield writer.writerow([])
+
+        # Get employee counts with the shared conditional-aggregate helper
+        attrition_summary = compute_attrition_summary(
+            build_inactive_filter(start_date, end_date))
+
+        yield writer.writerow(['Attrition Summary'])
+        yield writer.writerow(['Metric', 'Value'])
+        yield writer.writerow(['Total Employees', attrition_summary['total_employees']])
+        yield writer.writerow(['Employees Left', attrition_summary['employees_left']])
+        yield writer.writerow(['Attrition Rate (%)', attrition_summary['attrition_rate']])
+        yield writer.writerow([])
+
+        # Employee list; exists() is a cheap LIMIT-1 probe that skips the
+        # ordered scan entirely on an empty table
+        yield writer.writerow(['Employee List'])
+        yield writer.writerow(['Name', 'Department', 'Hire Date', 'Status'])
+        if not Employee.objects.exists():
+            return
+        employee_rows = Employee.objects.order_by('name').values_list(
+            'name', 'department', 'hire_date', 'is_active')
+        for chunk in batched(employee_rows.iterator(chunk_size=2000), 2000):
+            buffered_writer.writerows(
+                (name, department, hire_date.isoformat(),
+                 'Active' if is_active else 'Inactive')
+                for name, department, hire_date, is_active in chunk)
+            yield buffer.drain()